@@ -14,6 +14,7 @@ are called from within the get_activity_coefficient method of the Solution class
 """
 
 import logging
+from functools import lru_cache
 
 import numpy as np
 from pint import Quantity
@@ -24,13 +25,74 @@ from pyEQL.utils import create_water_substance
 logger = logging.getLogger(f"pyEQL.{__name__}")
 
 
-def _debye_parameter_B(temperature: str = "25 degC") -> Quantity:
+def _kelvin(temperature) -> float:
+    """
+    Return a temperature in Kelvin as a float.
+
+    Numbers are assumed to be in Kelvin already. Strings (e.g. '25 degC') and Quantity objects are converted.
+    Passing a number avoids the overhead of having pint parse the temperature on every call.
+    """
+    if isinstance(temperature, (int, float, np.number)):
+        return float(temperature)
+    return ureg.Quantity(temperature).to("K").magnitude
+
+
+def _molal_magnitude(amount):
+    """Return the magnitude of a molal concentration (or ionic strength) in mol/kg. Numbers and arrays pass through."""
+    if isinstance(amount, Quantity):
+        return amount.to("mol/kg").magnitude
+    return amount
+
+
+@lru_cache(maxsize=64)
+def _debye_B(temperature: float) -> float:
+    """
+    Return the magnitude of the parameter B (see _debye_parameter_B), in kg ** 0.5 / m / mol ** 0.5,
+    at a temperature in Kelvin. Cached because it only depends on temperature.
+    """
+    T = ureg.Quantity(temperature, "K")
+    water_substance = create_water_substance(
+        T,
+        ureg.Quantity(1, "atm"),
+    )
+
+    param_B = (
+        2
+        * ureg.N_A
+        * ureg.Quantity(water_substance.rho, "g/L")
+        * ureg.elementary_charge**2
+        / (ureg.epsilon_0 * water_substance.epsilon * ureg.boltzmann_constant * T)
+    ) ** 0.5
+    return param_B.to("kg ** 0.5 / m / mol ** 0.5").magnitude
+
+
+@lru_cache(maxsize=64)
+def _debye_A(temperature: float) -> float:
+    """
+    Return the magnitude of the parameter A (see _debye_parameter_activity), in kg ** 0.5 / mol ** 0.5,
+    at a temperature in Kelvin. Cached because it only depends on temperature.
+    """
+    T = ureg.Quantity(temperature, "K")
+    water_substance = create_water_substance(
+        T,
+        ureg.Quantity(1, "atm"),
+    )
+
+    debyeparam = (
+        ureg.elementary_charge**3
+        * (2 * np.pi * ureg.N_A * ureg.Quantity(water_substance.rho, "g/L")) ** 0.5
+        / (4 * np.pi * ureg.epsilon_0 * water_substance.epsilon * ureg.boltzmann_constant * T) ** 1.5
+    )
+    return debyeparam.to("kg ** 0.5 / mol ** 0.5").magnitude
+
+
+def _debye_parameter_B(temperature: str | float = "25 degC") -> Quantity:
     r"""
     Return the constant B used in the extended Debye-Huckel equation.
 
     Args:
-        temperature: The temperature of the solution at which to calculate the constant.
-            Defaults to '25 degC'.
+        temperature: The temperature of the solution at which to calculate the constant, as a string,
+            Quantity, or number in Kelvin. Defaults to '25 degC'.
 
     Returns:
         The parameter B for use in extended Debye-Huckel equation (base e). For base 10,
@@ -54,29 +116,16 @@ def _debye_parameter_B(temperature: str = "25 degC") -> Quantity:
 
         https://en.wikipedia.org/wiki/Debye%E2%80%93H%C3%BCckel_equation
     """
-    T = ureg.Quantity(temperature)
-    water_substance = create_water_substance(
-        T,
-        ureg.Quantity(1, "atm"),
-    )
+    return ureg.Quantity(_debye_B(_kelvin(temperature)), "kg ** 0.5 / m / mol ** 0.5")
 
-    param_B = (
-        2
-        * ureg.N_A
-        * ureg.Quantity(water_substance.rho, "g/L")
-        * ureg.elementary_charge**2
-        / (ureg.epsilon_0 * water_substance.epsilon * ureg.boltzmann_constant * T)
-    ) ** 0.5
-    return param_B.to_base_units()
 
-
-def _debye_parameter_activity(temperature: str = "25 degC") -> "Quantity":
+def _debye_parameter_activity(temperature: str | float = "25 degC") -> "Quantity":
     r"""
     Return the constant A for use in the Debye-Huckel limiting law (base e).
 
     Args:
-        temperature: The temperature of the solution at which to calculate the constant.
-            Defaults to '25 degC'.
+        temperature: The temperature of the solution at which to calculate the constant, as a string,
+            Quantity, or number in Kelvin. Defaults to '25 degC'.
 
     Returns:
         The parameter A for use in the Debye-Huckel limiting law (base e). For base 10,
@@ -106,20 +155,10 @@ def _debye_parameter_activity(temperature: str = "25 degC") -> "Quantity":
         :func:`_debye_parameter_osmotic`
 
     """
-    T = ureg.Quantity(temperature)
-    water_substance = create_water_substance(
-        T,
-        ureg.Quantity(1, "atm"),
-    )
-
-    debyeparam = (
-        ureg.elementary_charge**3
-        * (2 * np.pi * ureg.N_A * ureg.Quantity(water_substance.rho, "g/L")) ** 0.5
-        / (4 * np.pi * ureg.epsilon_0 * water_substance.epsilon * ureg.boltzmann_constant * T) ** 1.5
-    )
+    debyeparam = ureg.Quantity(_debye_A(_kelvin(temperature)), "kg ** 0.5 / mol ** 0.5")
 
     logger.debug(rf"Computed Debye-Huckel Limiting Law Constant A^{{\gamma}} = {debyeparam} at {temperature}")
-    return debyeparam.to("kg ** 0.5 / mol ** 0.5")
+    return debyeparam
 
 
 def _debye_parameter_osmotic(temperature="25 degC"):
@@ -127,7 +166,8 @@ def _debye_parameter_osmotic(temperature="25 degC"):
     Return the constant A_phi for use in calculating the osmotic coefficient according to Debye-Huckel theory.
 
     Args:
-        temperature: String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature: String representing the temperature of the solution, or a number in Kelvin. Defaults to
+            '25 degC' if not specified.
 
     Notes:
         Not to be confused with the Debye-Huckel constant used for activity coefficients in the limiting law.
@@ -162,7 +202,8 @@ def _debye_parameter_volume(temperature="25 degC"):
     molar volume.
 
     Args:
-        temperature: String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature: String representing the temperature of the solution, or a number in Kelvin. Defaults to
+            '25 degC' if not specified.
 
     Notes:
         Takes the value 1.8305 cm ** 3 * kg ** 0.5 /  mol ** 1.5 at 25 C.
@@ -192,7 +233,7 @@ def _debye_parameter_volume(temperature="25 degC"):
         :func:`_debye_parameter_osmotic`
 
     """
-    T = ureg.Quantity(temperature)
+    T = ureg.Quantity(_kelvin(temperature), "K")
     water_substance = create_water_substance(
         T,
         ureg.Quantity(1, "atm"),
@@ -214,6 +255,33 @@ def _debye_parameter_volume(temperature="25 degC"):
     return result.to("cm ** 3 * kg ** 0.5 /  mol ** 1.5")
 
 
+def _debyehuckel_log_gamma(ionic_strength, z, temperature, regime):
+    r"""
+    Return the natural logarithm of the activity coefficient according to one of the Debye-Huckel-type models.
+
+    The three models share the form
+
+    .. math:: \ln \gamma = -A^{\gamma} z_i^2 \left( {\sqrt I \over d} - c I \right)
+
+    where d = 1, c = 0 for the Debye-Huckel limiting law (regime 0), d = 1 + sqrt(I), c = 0 for the
+    Guntelberg approximation (regime 1), and d = 1 + sqrt(I), c = 0.2 for the Davies equation (regime 2).
+    All arguments except temperature may be numpy arrays.
+
+    Args:
+        ionic_strength: The ionic strength of the parent solution, mol/kg. Plain numbers are interpreted as mol/kg.
+        z: The charge on the solute, including sign.
+        temperature: The temperature of the solution, as a string, Quantity, or number in Kelvin.
+        regime: 0, 1, or 2, selecting the model as described above.
+    """
+    ionic_strength = _molal_magnitude(ionic_strength)
+    regime = np.asarray(regime)
+    sqrt_I = np.sqrt(ionic_strength)
+    denominator = np.where(regime == 0, 1, 1 + sqrt_I)
+    linear_term = np.where(regime == 2, 0.2 * ionic_strength, 0)
+
+    return -_debye_A(_kelvin(temperature)) * np.square(z) * (sqrt_I / denominator - linear_term)
+
+
 def get_activity_coefficient_debyehuckel(ionic_strength, z=1, temperature="25 degC"):
     r"""
     Return the activity coefficient of solute in the parent solution according to the Debye-Huckel limiting law.
@@ -221,7 +289,8 @@ def get_activity_coefficient_debyehuckel(ionic_strength, z=1, temperature="25 de
     Args:
         z (int, optional): The charge on the solute, including sign. Defaults to +1 if not specified.
         ionic_strength (Quantity): The ionic strength of the parent solution, mol/kg.
-        temperature (str, Quantity, optional): String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature (str, Quantity, float, optional): The temperature of the solution. Numbers are interpreted as
+            Kelvin. Defaults to '25 degC' if not specified.
 
     Returns:
         Quantity: The mean molal (mol/kg) scale ionic activity coefficient of solute, dimensionless.
@@ -243,12 +312,10 @@ def get_activity_coefficient_debyehuckel(ionic_strength, z=1, temperature="25 de
                pp 103. Wiley Interscience, 1996.
     """
     # check if this method is valid for the given ionic strength
-    if not ionic_strength.magnitude <= 0.005:
+    if not _molal_magnitude(ionic_strength) <= 0.005:
         logger.warning("Ionic strength exceeds valid range of the Debye-Huckel limiting law")
 
-    log_f = -_debye_parameter_activity(temperature) * z**2 * ionic_strength**0.5
-
-    return np.exp(log_f) * ureg.Quantity(1, "dimensionless")
+    return ureg.Quantity(np.exp(_debyehuckel_log_gamma(ionic_strength, z, temperature, 0)), "dimensionless")
 
 
 def get_activity_coefficient_guntelberg(ionic_strength, z=1, temperature="25 degC"):
@@ -258,7 +325,8 @@ def get_activity_coefficient_guntelberg(ionic_strength, z=1, temperature="25 deg
     Args:
         z (int, optional): The charge on the solute, including sign. Defaults to +1 if not specified.
         ionic_strength (Quantity): The ionic strength of the parent solution, mol/kg.
-        temperature (str, Quantity, optional): String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature (str, Quantity, float, optional): The temperature of the solution. Numbers are interpreted as
+            Kelvin. Defaults to '25 degC' if not specified.
 
     Returns:
         Quantity: The mean molal (mol/kg) scale ionic activity coefficient of solute, dimensionless.
@@ -280,12 +348,10 @@ def get_activity_coefficient_guntelberg(ionic_strength, z=1, temperature="25 deg
                pp 103. Wiley Interscience, 1996.
     """
     # check if this method is valid for the given ionic strength
-    if not ionic_strength.magnitude <= 0.1:
+    if not _molal_magnitude(ionic_strength) <= 0.1:
         logger.warning("Ionic strength exceeds valid range of the Guntelberg approximation")
 
-    log_f = -_debye_parameter_activity(temperature) * z**2 * ionic_strength**0.5 / (1 + ionic_strength.magnitude**0.5)
-
-    return np.exp(log_f) * ureg.Quantity(1, "dimensionless")
+    return ureg.Quantity(np.exp(_debyehuckel_log_gamma(ionic_strength, z, temperature, 1)), "dimensionless")
 
 
 def get_activity_coefficient_davies(ionic_strength, z=1, temperature="25 degC"):
@@ -295,7 +361,8 @@ def get_activity_coefficient_davies(ionic_strength, z=1, temperature="25 degC"):
     Args:
         ionic_strength (Quantity): The ionic strength of the parent solution, mol/kg.
         z (int, optional): The charge on the solute, including sign. Defaults to +1 if not specified.
-        temperature (str, Quantity, optional): String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature (str, Quantity, float, optional): The temperature of the solution. Numbers are interpreted as
+            Kelvin. Defaults to '25 degC' if not specified.
 
     Returns:
         Quantity: The mean molal (mol/kg) scale ionic activity coefficient of solute, dimensionless.
@@ -317,17 +384,11 @@ def get_activity_coefficient_davies(ionic_strength, z=1, temperature="25 degC"):
                pp 103. Wiley Interscience, 1996.
     """
     # check if this method is valid for the given ionic strength
-    if not ionic_strength.magnitude <= 0.5 and ionic_strength.magnitude >= 0.1:
+    if not _molal_magnitude(ionic_strength) <= 0.5 and _molal_magnitude(ionic_strength) >= 0.1:
         logger.warning("Ionic strength exceeds valid range of the Davies equation")
 
-    # the units in this empirical equation don't work out, so we must use magnitudes
-    log_f = (
-        -_debye_parameter_activity(temperature).magnitude
-        * z**2
-        * (ionic_strength.magnitude**0.5 / (1 + ionic_strength.magnitude**0.5) - 0.2 * ionic_strength.magnitude)
-    )
-
-    return np.exp(log_f) * ureg.Quantity(1, "dimensionless")
+    # the units in this empirical equation don't work out, so the calculation uses magnitudes
+    return ureg.Quantity(np.exp(_debyehuckel_log_gamma(ionic_strength, z, temperature, 2)), "dimensionless")
 
 
 def get_activity_coefficient_pitzer(
@@ -349,18 +410,21 @@ def get_activity_coefficient_pitzer(
     """
     Return the activity coefficient of solute in the parent solution according to the Pitzer model.
 
+    All arguments except temperature may be numpy arrays, in which case the activity coefficients of several
+    salts are evaluated in a single vectorized call.
+
     Args:
-        ionic_strength: The ionic strength of the parent solution, mol/kg
-        molality: The molal concentration of the parent salt, mol/kg
-        alpha1, alpha2: Coefficients for the Pitzer model. This function assigns the coefficients
-            proper units of kg ** 0.5 / mol ** 0.5 after they are entered.
+        ionic_strength: The ionic strength of the parent solution, mol/kg. Plain numbers are interpreted as mol/kg.
+        molality: The molal concentration of the parent salt, mol/kg. Plain numbers are interpreted as mol/kg.
+        alpha1, alpha2: Coefficients for the Pitzer model, kg ** 0.5 / mol ** 0.5.
         beta0, beta1, beta2, C_phi:  Coefficients for the Pitzer model. These ion-interaction parameters are
             specific to each salt system.
         z_cation, z_anion: The charge on the cation and anion, respectively
         nu_cation, nu_anion: The stoichiometric coefficient of the cation and anion in the salt
-        temperature: String representing the temperature of the solution. Defaults to '25 degC' if not specified.
-        b: Coefficient. Usually set equal to 1.2 and considered independent of temperature and pressure.
-            If provided, this coefficient is assigned proper units of kg ** 0.5 / mol ** 0.5  after entry.
+        temperature: String representing the temperature of the solution, or a number in Kelvin. Defaults to
+            '25 degC' if not specified.
+        b: Coefficient. Usually set equal to 1.2 kg ** 0.5 / mol ** 0.5 and considered independent of temperature
+            and pressure.
 
     Returns:
         Quantity
@@ -413,15 +477,9 @@ def get_activity_coefficient_pitzer(
         :func:`_pitzer_B_phi`
         :func:`_pitzer_log_gamma`
     """
-    # assign proper units to alpha1, alpha2, and b
-    alpha1 = ureg.Quantity(alpha1, "kg ** 0.5 / mol ** 0.5")
-    alpha2 = ureg.Quantity(alpha2, "kg ** 0.5 / mol ** 0.5")
-    b = ureg.Quantity(b, "kg ** 0.5 / mol ** 0.5")
-    C_phi = ureg.Quantity(C_phi, "kg ** 2 /mol ** 2")
-
-    # assign units appropriate for the activity parameters
-    BMX = ureg.Quantity(_pitzer_B_MX(ionic_strength, alpha1, alpha2, beta0, beta1, beta2), "kg/mol")
-    Bphi = ureg.Quantity(_pitzer_B_phi(ionic_strength, alpha1, alpha2, beta0, beta1, beta2), "kg/mol")
+    # B_MX and B_phi are in kg/mol
+    BMX = _pitzer_B_MX(ionic_strength, alpha1, alpha2, beta0, beta1, beta2)
+    Bphi = _pitzer_B_phi(ionic_strength, alpha1, alpha2, beta0, beta1, beta2)
 
     loggamma = _pitzer_log_gamma(
         ionic_strength,
@@ -437,7 +495,7 @@ def get_activity_coefficient_pitzer(
         b,
     )
 
-    return np.exp(loggamma) * ureg.Quantity(1, "dimensionless")
+    return ureg.Quantity(np.exp(loggamma), "dimensionless")
 
 
 def get_apparent_volume_pitzer(
@@ -468,7 +526,8 @@ def get_apparent_volume_pitzer(
         V_o (number): The V^o Pitzer coefficient for the apparent molar volume.
         z_cation, z_anion (int): The formal charge on the cation and anion, respectively.
         nu_cation, nu_anion (int): The stoichiometric coefficient of the cation and anion in the salt.
-        temperature (str, Quantity): String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature (str, Quantity, float): The temperature of the solution. Numbers are interpreted as Kelvin.
+            Defaults to '25 degC' if not specified.
         b (number, optional): Coefficient. Usually set equal to 1.2 and considered independent of temperature and pressure. If provided, this coefficient is assigned proper units of kg ** 0.5 / mol ** 0.5  after entry.
 
     Returns:
@@ -520,8 +579,6 @@ def get_apparent_volume_pitzer(
     """
     # TODO - find a cleaner way to make sure coefficients are assigned the proper units
     # if they aren't, the calculation gives very wrong results
-    alpha1 = ureg.Quantity(alpha1, "kg ** 0.5 / mol ** 0.5")
-    alpha2 = ureg.Quantity(alpha2, "kg ** 0.5 / mol ** 0.5")
     b = ureg.Quantity(b, "kg ** 0.5 / mol ** 0.5")
     C_phi = ureg.Quantity(C_phi, "kg ** 2 /mol ** 2 / dabar")
     V_o = ureg.Quantity(V_o, "cm ** 3 / mol")
@@ -540,7 +597,7 @@ def get_apparent_volume_pitzer(
         nu_cation
         * nu_anion
         * ureg.R
-        * ureg.Quantity(temperature)
+        * ureg.Quantity(_kelvin(temperature), "K")
         * (2 * molality * BMX + molality**2 * C_phi * (nu_cation * nu_anion) ** 0.5)
     )
 
@@ -563,10 +620,12 @@ def _pitzer_f1(x):
         Kim, H., & Jr, W. F. (1988). Evaluation of Pitzer ion interaction parameters of aqueous electrolytes at 25 degree C. 1. Single salt parameters.
         Journal of Chemical and Engineering Data, (2), 177-184.
     """
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f1 = 2 * (1 - (1 + x) * np.exp(-x)) / x**2
     # return 0 if the input is 0
-    if x == 0:
-        return 0
-    return 2 * (1 - (1 + x) * np.exp(-x)) / x**2
+    # indexing with () returns a scalar for scalar input, and the whole array otherwise
+    return np.where(x == 0, 0.0, f1)[()]
 
 
 def _pitzer_f2(x):
@@ -602,7 +661,7 @@ def _pitzer_B_MX(ionic_strength, alpha1, alpha2, beta0, beta1, beta2):
             specific to each salt system.
 
     Returns:
-        The B_MX parameter for the Pitzer ion interaction model.
+        The B_MX parameter for the Pitzer ion interaction model, as a number or numpy array.
 
     References:
         Scharge, T., Munoz, A.G., and Moog, H.C. (2012). Activity Coefficients of Fission Products in Highly
@@ -616,8 +675,8 @@ def _pitzer_B_MX(ionic_strength, alpha1, alpha2, beta0, beta1, beta2):
         :func:`_pitzer_f1`
 
     """
-    coeff = beta0 + beta1 * _pitzer_f1(alpha1 * ionic_strength**0.5) + beta2 * _pitzer_f1(alpha2 * ionic_strength**0.5)
-    return coeff.magnitude
+    sqrt_I = np.sqrt(_molal_magnitude(ionic_strength))
+    return beta0 + beta1 * _pitzer_f1(alpha1 * sqrt_I) + beta2 * _pitzer_f1(alpha2 * sqrt_I)
 
 
 # def _pitzer_B_gamma(ionic_strength,alpha1,alpha2,beta1,beta2):
@@ -678,7 +737,7 @@ def _pitzer_B_phi(ionic_strength, alpha1, alpha2, beta0, beta1, beta2):
             specific to each salt system.
 
     Returns:
-        float: The B^Phi parameter for the Pitzer ion interaction model.
+        float: The B^Phi parameter for the Pitzer ion interaction model, as a number or numpy array.
 
     References:
         Scharge, T., Munoz, A.G., and Moog, H.C. (2012). Activity Coefficients of Fission Products in Highly
@@ -692,11 +751,8 @@ def _pitzer_B_phi(ionic_strength, alpha1, alpha2, beta0, beta1, beta2):
         and Representation with an Ion Interaction (Pitzer) Model.
         Journal of Chemical & Engineering Data, 55(2), 830-838. doi:10.1021/je900487a
     """
-    import math
-
-    # TODO - for some reason this specific method requires the use of math.exp rather than np.exp. Using np.exp raises
-    # a dimensionalityerror.
-    return beta0 + beta1 * math.exp(-alpha1 * ionic_strength**0.5) + beta2 * math.exp(-alpha2 * ionic_strength**0.5)
+    sqrt_I = np.sqrt(_molal_magnitude(ionic_strength))
+    return beta0 + beta1 * np.exp(-alpha1 * sqrt_I) + beta2 * np.exp(-alpha2 * sqrt_I)
 
 
 # def _pitzer_C_MX(C_phi,z_cation,z_anion):
@@ -743,7 +799,7 @@ def _pitzer_log_gamma(
     nu_cation,
     nu_anion,
     temperature="25 degC",
-    b=ureg.Quantity(1.2, "kg**0.5/mol**0.5"),
+    b=1.2,
 ):
     r"""
     Returns the natural logarithm of the binary activity coefficient calculated by the Pitzer
@@ -756,10 +812,12 @@ def _pitzer_log_gamma(
     Args:
         ionic_strength (Quantity): The ionic strength of the parent solution, mol/kg.
         molality (Quantity): The concentration of the salt, mol/kg.
-        B_MX, B_phi, C_phi (Quantity): Calculated parameters for the Pitzer ion interaction model.
+        B_MX, B_phi (number): Calculated parameters for the Pitzer ion interaction model, kg/mol.
+        C_phi (number): Parameter for the Pitzer ion interaction model, kg ** 2 / mol ** 2.
         z_cation, z_anion (int): The formal charge on the cation and anion, respectively.
         nu_cation, nu_anion (int): The stoichiometric coefficient of the cation and anion in the salt.
-        temperature (str, Quantity): String representing the temperature of the solution. Defaults to '25 degC' if not specified.
+        temperature (str, Quantity, float): The temperature of the solution. Numbers are interpreted as Kelvin.
+            Defaults to '25 degC' if not specified.
         b (number, optional): Coefficient. Usually set equal to 1.2 kg ** 0.5 / mol ** 0.5 and considered independent of temperature and pressure.
 
     Returns:
@@ -772,12 +830,13 @@ def _pitzer_log_gamma(
         May, P. M., Rowland, D., Hefter, G., & Königsberger, E. (2011). A Generic and Updatable Pitzer Characterization of Aqueous Binary Electrolyte Solutions at 1 bar and 25 °C.
         Journal of Chemical & Engineering Data, 56(12), 5066-5077. doi:10.1021/je2009329
     """
-    first_term = (
-        -1
-        * abs(z_cation * z_anion)
-        * _debye_parameter_osmotic(temperature)
-        * (ionic_strength**0.5 / (1 + b * ionic_strength**0.5) + 2 / b * np.log(1 + b * ionic_strength**0.5))
-    )
+    ionic_strength = _molal_magnitude(ionic_strength)
+    molality = _molal_magnitude(molality)
+    sqrt_I = np.sqrt(ionic_strength)
+    # the Debye-Huckel slope for the osmotic coefficient, A_phi = A_gamma / 3 (see _debye_parameter_osmotic)
+    A_phi = 1 / 3 * _debye_A(_kelvin(temperature))
+
+    first_term = -1 * np.abs(z_cation * z_anion) * A_phi * (sqrt_I / (1 + b * sqrt_I) + 2 / b * np.log(1 + b * sqrt_I))
     second_term = 2 * molality * nu_cation * nu_anion / (nu_cation + nu_anion) * (B_MX + B_phi)
     third_term = 3 * molality**2 * (nu_cation * nu_anion) ** 1.5 / (nu_cation + nu_anion) * C_phi
 
@@ -803,15 +862,21 @@ def get_osmotic_coefficient_pitzer(
     """
     Return the osmotic coefficient of water in an electrolyte solution according to the Pitzer model.
 
+    All arguments except temperature may be numpy arrays, in which case the osmotic coefficients of several
+    salts are evaluated in a single vectorized call.
+
     Args:
-        ionic_strength (Quantity): The ionic strength of the parent solution, mol/kg.
-        molality (Quantity): The molal concentration of the parent salt, mol/kg.
-        alpha1, alpha2 (number): Coefficients for the Pitzer model. This function assigns the coefficients proper units of kg ** 0.5 / mol ** 0.5 after they are entered.
+        ionic_strength (Quantity): The ionic strength of the parent solution, mol/kg. Plain numbers are interpreted
+            as mol/kg.
+        molality (Quantity): The molal concentration of the parent salt, mol/kg. Plain numbers are interpreted
+            as mol/kg.
+        alpha1, alpha2 (number): Coefficients for the Pitzer model, kg ** 0.5 / mol ** 0.5.
         beta0, beta1, beta2, C_phi: Coefficients for the Pitzer model. These ion-interaction parameters are specific to each salt system.
         z_cation, z_anion (int): The formal charge on the cation and anion, respectively.
         nu_cation, nu_anion (int): The stoichiometric coefficient of the cation and anion in the salt.
-        temperature (str, Quantity): String representing the temperature of the solution. Defaults to '25 degC' if not specified.
-        b (number, optional): Coefficient. Usually set equal to 1.2 and considered independent of temperature and pressure. If provided, this coefficient is assigned proper units of kg ** 0.5 / mol ** 0.5  after entry.
+        temperature (str, Quantity, float): The temperature of the solution. Numbers are interpreted as Kelvin.
+            Defaults to '25 degC' if not specified.
+        b (number, optional): Coefficient. Usually set equal to 1.2 kg ** 0.5 / mol ** 0.5 and considered independent of temperature and pressure.
 
     Returns:
         Quantity: The osmotic coefficient of water, dimensionless.
@@ -863,17 +928,18 @@ def get_osmotic_coefficient_pitzer(
         :func:`_pitzer_B_phi`
         :func:`_pitzer_log_gamma`
     """
-    # assign proper units to alpha1, alpha2, and b
-    alpha1 = ureg.Quantity(alpha1, "kg ** 0.5 / mol ** 0.5")
-    alpha2 = ureg.Quantity(alpha2, "kg ** 0.5 / mol ** 0.5")
-    b = ureg.Quantity(b, "kg ** 0.5 / mol ** 0.5")
-    C_phi = ureg.Quantity(C_phi, "kg ** 2 /mol ** 2")
-    B_phi = ureg.Quantity(_pitzer_B_phi(ionic_strength, alpha1, alpha2, beta0, beta1, beta2), "kg/mol")
+    # work with magnitudes in mol/kg so that the calculation can be broadcast over arrays of salts
+    # alpha1, alpha2, and b are in kg ** 0.5 / mol ** 0.5, B_phi in kg/mol, and C_phi in kg ** 2 / mol ** 2
+    ionic_strength = _molal_magnitude(ionic_strength)
+    molality = _molal_magnitude(molality)
+    sqrt_I = np.sqrt(ionic_strength)
 
-    first_term = 1 - _debye_parameter_osmotic(temperature) * abs(z_cation * z_anion) * ionic_strength**0.5 / (
-        1 + b * ionic_strength**0.5
-    )
+    B_phi = _pitzer_B_phi(ionic_strength, alpha1, alpha2, beta0, beta1, beta2)
+
+    # the Debye-Huckel slope for the osmotic coefficient, A_phi = A_gamma / 3 (see _debye_parameter_osmotic)
+    A_phi = 1 / 3 * _debye_A(_kelvin(temperature))
+    first_term = 1 - A_phi * np.abs(z_cation * z_anion) * sqrt_I / (1 + b * sqrt_I)
     second_term = molality * 2 * nu_cation * nu_anion / (nu_cation + nu_anion) * B_phi
     third_term = molality**2 * (2 * (nu_cation * nu_anion) ** 1.5 / (nu_cation + nu_anion)) * C_phi
 
-    return first_term + second_term + third_term
+    return ureg.Quantity(first_term + second_term + third_term, "dimensionless")
@@ -10,14 +10,16 @@ import logging
 import os
 import warnings
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 from phreeqpython import PhreeqPython
 
 import pyEQL.activity_correction as ac
 from pyEQL import ureg
-from pyEQL.salt_ion_match import Salt
+from pyEQL.salt_ion_match import Salt, SaltBatch, generate_salt_arrays
 from pyEQL.utils import standardize_formula
 
 # These are the only elements that are allowed to have parenthetical oxidation states
@@ -29,6 +31,60 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from pyEQL import Solution
 
+# Pitzer model coefficients (alpha1, alpha2), in kg ** 0.5 / mol ** 0.5, for salts in which at
+# least one ion is monovalent, 2:2 salts, and salts containing higher-valence ions, respectively
+_PITZER_ALPHAS = np.array([[2.0, 0.0], [1.4, 12.0], [2.0, 50.0]])
+
+
+def _pitzer_alphas(z_cation, z_anion) -> tuple:
+    """
+    Return the Pitzer coefficients alpha1 and alpha2 for a salt, based on the charges of its ions.
+
+    The charges may be numbers or arrays, in which case arrays of alpha1 and alpha2 are returned.
+    See May et al. (2011), doi:10.1021/je2009329, for the rules used to assign the coefficients.
+    """
+    z_cation = np.asarray(z_cation)
+    z_anion = np.asarray(z_anion)
+    row = np.where((z_cation >= 2) & (z_anion <= -2), np.minimum(np.maximum(z_cation, -z_anion), 3) - 1, 0)
+    alpha1, alpha2 = _PITZER_ALPHAS[row.astype(int)].T
+    return alpha1, alpha2
+
+
+# upper ionic strength limits, in mol/kg, of the activity models used when Pitzer parameters are not available.
+# The position of the ionic strength in this array is the regime passed to ac._debyehuckel_log_gamma
+_LOW_I_THRESHOLDS = np.array([0.005, 0.1, 0.5])
+_LOW_I_MODELS = ("Debye-Huckel", "Guntelberg", "Davies equation")
+
+
+@lru_cache(maxsize=256)
+def _parse_pitzer_values(values: tuple[str, ...]) -> tuple[float, ...]:
+    """Convert Pitzer parameter strings from the database (e.g. '0.0783 dimensionless') into floats."""
+    return tuple(ureg.Quantity(v).magnitude for v in values)
+
+
+# names of the Pitzer parameters of each model, in the order they are passed to the model functions
+_PITZER_PARAM_KEYS = {
+    "activity_pitzer": ("Beta0", "Beta1", "Beta2", "Cphi"),
+    "molar_volume_pitzer": ("Beta0", "Beta1", "Beta2", "Cphi", "V_o"),
+}
+
+
+def _get_pitzer_params(
+    solution: "Solution", formula: str, model: Literal["activity_pitzer", "molar_volume_pitzer"] = "activity_pitzer"
+) -> tuple[float, ...] | None:
+    """
+    Return the Pitzer parameters of a salt as floats, or None if they are not available in the Solution's
+    database. These are (Beta0, Beta1, Beta2, Cphi) for the activity model and (Beta0, Beta1, Beta2, Cphi, V_o)
+    for the molar volume model.
+
+    The database lookup is cached by Solution.get_property, and the parsed values are cached
+    based on the parameter strings themselves, so neither cache depends on which database is used.
+    """
+    param = solution.get_property(formula, f"model_parameters.{model}")
+    if param is None:
+        return None
+    return _parse_pitzer_values(tuple(param[k]["value"] for k in _PITZER_PARAM_KEYS[model]))
+
 
 class EOS(ABC):
     """
@@ -57,6 +113,28 @@ class EOS(ABC):
             ValueError if the calculation cannot be completed, e.g. due to insufficient number of parameters.
         """
 
+    def get_activity_coefficients(
+        self, solution: "Solution", solutes: list[str] | None = None
+    ) -> dict[str, ureg.Quantity]:
+        """
+        Return the *molal scale* activity coefficients of several solutes, given a Solution
+        object.
+
+        Subclasses may override this method to evaluate the solutes together more efficiently.
+        By default, get_activity_coefficient is called once for each solute.
+
+        Args:
+            solution: pyEQL Solution object
+            solutes: list of str identifying the solutes of interest. Defaults to all the
+                components of the Solution.
+
+        Returns:
+            dict: dimensionless quantity objects, keyed by the solutes as given
+        """
+        if solutes is None:
+            solutes = list(solution.components.keys())
+        return {solute: self.get_activity_coefficient(solution, solute) for solute in solutes}
+
     @abstractmethod
     def get_osmotic_coefficient(self, solution: "Solution") -> ureg.Quantity:
         """
@@ -167,6 +245,7 @@ class NativeEOS(EOS):
         try:
             self.pp = PhreeqPython(database=self.phreeqc_db, database_directory=self.db_path)
         except OSError:
+            self.pp = None
             logger.error(
                 "OSError encountered when trying to instantiate phreeqpython. Most likely this means you"
                 " are running on an architecture that is not supported by PHREEQC, such as Apple M1/M2 chips."
@@ -176,6 +255,31 @@ class NativeEOS(EOS):
         self.ppsol = None
         # store the solution composition to see whether we need to re-instantiate the solution
         self._stored_comp = None
+        # salts identified in the solution, keyed by salt formula, as (Salt, moles) tuples, and the
+        # predominant Salt containing each ion. These are only re-calculated when the composition changes.
+        self._salt_comp = None
+        self._salts: dict[str, tuple[Salt, float]] = {}
+        self._ion_salts: dict[str, Salt] = {}
+        # the same salts, excluding water, as parallel arrays for vectorized calculations
+        self._salt_batch: SaltBatch = generate_salt_arrays([], [])
+
+    def _update_salts(self, solution: "Solution") -> None:
+        """Re-identify the salts in a Solution, if its composition has changed since the last call."""
+        if self._salt_comp is not None and solution.components == self._salt_comp:
+            return
+
+        self._salt_comp = solution.components.copy()
+        self._salts = {}
+        self._ion_salts = {}
+        # salts are listed in order of decreasing predominance, so the first salt that
+        # contains a given ion is the predominant salt for that ion
+        for formula, d in solution.get_salt_dict().items():
+            salt = Salt(d["cation"], d["anion"])
+            self._salts[formula] = (salt, d["mol"])
+            self._ion_salts.setdefault(salt.cation, salt)
+            self._ion_salts.setdefault(salt.anion, salt)
+        solutes = [(salt, mol) for salt, mol in self._salts.values() if salt.formula != "HOH"]
+        self._salt_batch = generate_salt_arrays([salt for salt, _ in solutes], [mol for _, mol in solutes])
 
     def _setup_ppsol(self, solution: "Solution") -> None:
         """Helper method to set up a PhreeqPython solution for subsequent analysis."""
@@ -318,42 +422,70 @@ class NativeEOS(EOS):
             :func:`pyEQL.activity_correction.get_activity_coefficient_davies`
             :func:`pyEQL.activity_correction.get_activity_coefficient_pitzer`
         """
-        # identify the predominant salt that this ion is a member of
-        salt = None
-        rform = standardize_formula(solute)
-        for v in solution.get_salt_dict().values():
-            if v == "HOH":
+        return self.get_activity_coefficients(solution, [solute])[solute]
+
+    def get_activity_coefficients(
+        self, solution: "Solution", solutes: list[str] | None = None
+    ) -> dict[str, ureg.Quantity]:
+        """
+        Return the *molal scale* activity coefficients of several solutes at once.
+
+        The models are selected as described in get_activity_coefficient. The salts containing the solutes are
+        identified once, and each model is evaluated in a single vectorized call for all of the solutes that use it.
+
+        Args:
+            solution: pyEQL Solution object
+            solutes: list of str identifying the solutes of interest. Defaults to all the
+                components of the Solution.
+
+        Returns:
+            dict: dimensionless quantity objects, keyed by the solutes as given
+        """
+        if solutes is None:
+            solutes = list(solution.components.keys())
+        # solution temperature in Kelvin
+        temperature = solution.temperature.magnitude
+        # ionic strength is recomputed from the composition on every access, so evaluate it once
+        ionic_strength = solution.ionic_strength
+
+        activity_coefficients = {}
+        # parent salts that have Pitzer parameters, with those parameters and the solutes that belong to them
+        pitzer_salts: dict[str, tuple[Salt, tuple[float, ...], list[str]]] = {}
+        # solutes whose parent salt has no Pitzer parameters
+        other_solutes = []
+
+        # identify the predominant salt that each ion is a member of
+        self._update_salts(solution)
+        for solute in solutes:
+            salt = self._ion_salts.get(standardize_formula(solute))
+
+            # show an error if no salt can be found that contains the solute
+            if salt is None:
+                logger.error(f"No salts found that contain solute {solute}. Returning unit activity coefficient.")
+                activity_coefficients[solute] = ureg.Quantity(1, "dimensionless")
                 continue
-            if rform == v["cation"] or rform == v["anion"]:
-                del v["mol"]
-                salt = Salt.from_dict(v)
-                break
-
-        # show an error if no salt can be found that contains the solute
-        if salt is None:
-            logger.error(f"No salts found that contain solute {solute}. Returning unit activity coefficient.")
-            return ureg.Quantity(1, "dimensionless")
 
-        # use the Pitzer model for higher ionic strength, if the parameters are available
-        # search for Pitzer parameters
-        param = solution.get_property(salt.formula, "model_parameters.activity_pitzer")
-        if param is not None:
-            # TODO - consider re-enabling a log message recording what salt(s) are used as basis for activity calculation
-            logger.info(f"Calculating activity coefficient based on parent salt {salt.formula}")
+            # use the Pitzer model for higher ionic strength, if the parameters are available
+            if salt.formula in pitzer_salts:
+                pitzer_salts[salt.formula][2].append(solute)
+                continue
+            param = _get_pitzer_params(solution, salt.formula)
+            if param is not None:
+                # TODO - consider re-enabling a log message recording what salt(s) are used as basis for activity
+                # calculation
+                logger.info(f"Calculating activity coefficient based on parent salt {salt.formula}")
+                pitzer_salts[salt.formula] = (salt, param, [solute])
+            else:
+                other_solutes.append(solute)
+
+        if len(pitzer_salts) > 0:
+            salts, params, salt_solutes = zip(*pitzer_salts.values(), strict=True)
+            z_cation, z_anion, nu_cation, nu_anion = np.array(
+                [(salt.z_cation, salt.z_anion, salt.nu_cation, salt.nu_anion) for salt in salts], dtype=float
+            ).T
 
             # determine alpha1 and alpha2 based on the type of salt
-            # see the May reference for the rules used to determine
-            # alpha1 and alpha2 based on charge
-            if salt.nu_cation >= 2 and salt.nu_anion <= -2:
-                if salt.nu_cation >= 3 or salt.nu_anion <= -3:
-                    alpha1 = 2.0
-                    alpha2 = 50.0
-                else:
-                    alpha1 = 1.4
-                    alpha2 = 12
-            else:
-                alpha1 = 2.0
-                alpha2 = 0.0
+            alpha1, alpha2 = _pitzer_alphas(z_cation, z_anion)
 
             # determine the average molality of the salt
             # this is necessary for solutions inside e.g. an ion exchange
@@ -361,73 +493,55 @@ class NativeEOS(EOS):
             # unequal
             # molality = (solution.get_amount(salt.cation,'mol/kg')/salt.nu_cation+solution.get_amount(salt.anion,'mol/kg')/salt.nu_anion)/2
 
-            # determine the effective molality of the salt in the solution
-            molality = salt.get_effective_molality(solution.ionic_strength)
+            # determine the effective molality of each salt in the solution, in mol/kg. This is the same
+            # calculation as Salt.get_effective_molality, done with floats to avoid unit conversions
+            molality = 2 * ionic_strength.magnitude / (nu_cation * z_cation**2 + nu_anion * z_anion**2)
 
-            activity_coefficient = ac.get_activity_coefficient_pitzer(
-                solution.ionic_strength,
+            gammas = ac.get_activity_coefficient_pitzer(
+                ionic_strength.magnitude,
                 molality,
                 alpha1,
                 alpha2,
-                ureg.Quantity(param["Beta0"]["value"]).magnitude,
-                ureg.Quantity(param["Beta1"]["value"]).magnitude,
-                ureg.Quantity(param["Beta2"]["value"]).magnitude,
-                ureg.Quantity(param["Cphi"]["value"]).magnitude,
-                salt.z_cation,
-                salt.z_anion,
-                salt.nu_cation,
-                salt.nu_anion,
-                str(solution.temperature),
-            )
-
-            logger.debug(
-                f"Calculated activity coefficient of species {solute} as {activity_coefficient} based on salt"
-                f" {salt} using Pitzer model"
-            )
-            molal = activity_coefficient
-
-        # for very low ionic strength, use the Debye-Huckel limiting law
-        elif solution.ionic_strength.magnitude <= 0.005:
-            logger.debug(
-                f"Ionic strength = {solution.ionic_strength}. Using Debye-Huckel to calculate activity coefficient."
-            )
-            molal = ac.get_activity_coefficient_debyehuckel(
-                solution.ionic_strength,
-                solution.get_property(solute, "charge"),
-                str(solution.temperature),
-            )
-
-        # use the Guntelberg approximation for 0.005 < I < 0.1
-        elif solution.ionic_strength.magnitude <= 0.1:
-            logger.debug(
-                f"Ionic strength = {solution.ionic_strength}. Using Guntelberg to calculate activity coefficient."
-            )
-            molal = ac.get_activity_coefficient_guntelberg(
-                solution.ionic_strength,
-                solution.get_property(solute, "charge"),
-                str(solution.temperature),
-            )
-
-        # use the Davies equation for 0.1 < I < 0.5
-        elif solution.ionic_strength.magnitude <= 0.5:
-            logger.debug(
-                f"Ionic strength = {solution.ionic_strength}. Using Davies equation to calculate activity coefficient."
-            )
-            molal = ac.get_activity_coefficient_davies(
-                solution.ionic_strength,
-                solution.get_property(solute, "charge"),
-                str(solution.temperature),
-            )
-
-        else:
-            logger.error(
-                f"Ionic strength too high to estimate activity for species {solute}. Specify parameters for Pitzer "
-                "model. Returning unit activity coefficient"
-            )
+                *np.array(params).T,
+                z_cation,
+                z_anion,
+                nu_cation,
+                nu_anion,
+                temperature,
+            ).magnitude
+
+            for salt, gamma, members in zip(salts, gammas, salt_solutes, strict=True):
+                logger.debug(
+                    f"Calculated activity coefficient of species {members} as {gamma} based on salt"
+                    f" {salt} using Pitzer model"
+                )
+                for solute in members:
+                    activity_coefficients[solute] = ureg.Quantity(gamma, "dimensionless")
+
+        # otherwise fall back to a Debye-Huckel-type model chosen by ionic strength:
+        # Debye-Huckel limiting law for I <= 0.005, Guntelberg approximation for 0.005 < I <= 0.1,
+        # and the Davies equation for 0.1 < I <= 0.5
+        if len(other_solutes) > 0:
+            regime = int(np.searchsorted(_LOW_I_THRESHOLDS, ionic_strength.magnitude))
+            if regime < len(_LOW_I_MODELS):
+                logger.debug(
+                    f"Ionic strength = {ionic_strength}. Using {_LOW_I_MODELS[regime]} to calculate activity"
+                    f" coefficients of species {other_solutes}."
+                )
+                charges = np.array([solution.get_property(solute, "charge") for solute in other_solutes], dtype=float)
+                gammas = np.exp(ac._debyehuckel_log_gamma(ionic_strength.magnitude, charges, temperature, regime))
+                for solute, gamma in zip(other_solutes, gammas, strict=True):
+                    activity_coefficients[solute] = ureg.Quantity(gamma, "dimensionless")
 
-            molal = ureg.Quantity(1, "dimensionless")
+            else:
+                for solute in other_solutes:
+                    logger.error(
+                        f"Ionic strength too high to estimate activity for species {solute}. Specify parameters for "
+                        "Pitzer model. Returning unit activity coefficient"
+                    )
+                    activity_coefficients[solute] = ureg.Quantity(1, "dimensionless")
 
-        return molal
+        return {solute: activity_coefficients[solute] for solute in solutes}
 
     def get_osmotic_coefficient(self, solution: "Solution") -> ureg.Quantity:
         r"""
@@ -502,135 +616,113 @@ class NativeEOS(EOS):
 
         """
         ionic_strength = solution.ionic_strength
+        solvent_mass = solution.solvent_mass.to("kg").magnitude
+        # solution temperature in Kelvin
+        temperature = solution.temperature.magnitude
+
+        # the osmotic coefficients of all salts are calculated in a single vectorized call
+        # and averaged into an effective osmotic coefficient
+        self._update_salts(solution)
+        batch = self._salt_batch
+
+        # molality of each salt, in mol/kg
+        concentrations = batch.mol / solvent_mass
+        if concentrations.sum() == 0:
+            # this means the solution is empty
+            return ureg.Quantity(1, "dimensionless")
 
-        effective_osmotic_sum = 0
-        molality_sum = 0
-
-        # loop through all the salts in the solution, calculate the osmotic
-        # coefficint for each, and average them into an effective osmotic
-        # coefficient
-        for d in solution.get_salt_dict().values():
-            item = Salt(d["cation"], d["anion"])
-            # ignore HOH in the salt list
-            if item.formula == "HOH":
-                continue
+        # Pitzer parameters of each salt, if available
+        params = [_get_pitzer_params(solution, formula) for formula in batch.formulas]
+        idx = np.array([i for i, param in enumerate(params) if param is not None], dtype=int)
+        for formula, param in zip(batch.formulas, params, strict=True):
+            if param is None:
+                logger.debug(
+                    f"Returning unit osmotic coefficient for salt {formula} because Pitzer parameters are not"
+                    "available in database."
+                )
 
+        # salts without Pitzer parameters are assigned a unit osmotic coefficient
+        osmotic_coefficients = np.ones(len(concentrations))
+        if len(idx) > 0:
+            beta0, beta1, beta2, C_phi = np.array([params[i] for i in idx]).T
+            z_cation, z_anion = batch.z_cation[idx], batch.z_anion[idx]
             # determine alpha1 and alpha2 based on the type of salt
-            # see the May reference for the rules used to determine
-            # alpha1 and alpha2 based on charge
-            if item.z_cation >= 2 and item.z_anion <= -2:
-                if item.z_cation >= 3 or item.z_anion <= -3:
-                    alpha1 = 2.0
-                    alpha2 = 50.0
-                else:
-                    alpha1 = 1.4
-                    alpha2 = 12.0
-            else:
-                alpha1 = 2.0
-                alpha2 = 0
-
-            # set the concentration as the average concentration of the cation and
-            # anion in the salt, accounting for stoichiometry
-            # concentration = (solution.get_amount(Salt.cation,'mol/kg')/Salt.nu_cation + \
-            # solution.get_amount(Salt.anion,'mol/kg')/Salt.nu_anion)/2
-
-            # get the effective molality of the salt
-            concentration = ureg.Quantity(d["mol"], "mol") / solution.solvent_mass
+            alpha1, alpha2 = _pitzer_alphas(z_cation, z_anion)
 
-            molality_sum += concentration
-
-            param = solution.get_property(item.formula, "model_parameters.activity_pitzer")
-            if param is not None:
-                osmotic_coefficient = ac.get_osmotic_coefficient_pitzer(
-                    ionic_strength,
-                    concentration,
-                    alpha1,
-                    alpha2,
-                    ureg.Quantity(param["Beta0"]["value"]).magnitude,
-                    ureg.Quantity(param["Beta1"]["value"]).magnitude,
-                    ureg.Quantity(param["Beta2"]["value"]).magnitude,
-                    ureg.Quantity(param["Cphi"]["value"]).magnitude,
-                    item.z_cation,
-                    item.z_anion,
-                    item.nu_cation,
-                    item.nu_anion,
-                    str(solution.temperature),
-                )
+            osmotic_coefficients[idx] = ac.get_osmotic_coefficient_pitzer(
+                ionic_strength,
+                concentrations[idx],
+                alpha1,
+                alpha2,
+                beta0,
+                beta1,
+                beta2,
+                C_phi,
+                z_cation,
+                z_anion,
+                batch.nu_cation[idx],
+                batch.nu_anion[idx],
+                temperature,
+            ).magnitude
 
-                logger.debug(
-                    f"Calculated osmotic coefficient of water as {osmotic_coefficient} based on salt "
-                    f"{item.formula} using Pitzer model"
-                )
-                effective_osmotic_sum += concentration * osmotic_coefficient
+            logger.debug(
+                f"Calculated osmotic coefficients of water as {osmotic_coefficients[idx]} based on salts "
+                f"{[batch.formulas[i] for i in idx]} using Pitzer model"
+            )
 
-            else:
-                logger.debug(
-                    f"Returning unit osmotic coefficient for salt {item.formula} because Pitzer parameters are not"
-                    "available in database."
-                )
-                effective_osmotic_sum += concentration * 1
-
-        try:
-            return effective_osmotic_sum / molality_sum
-        except ZeroDivisionError:
-            # this means the solution is empty
-            return 1
+        # concentration-weighted average of the individual osmotic coefficients
+        return ureg.Quantity(np.dot(concentrations, osmotic_coefficients) / concentrations.sum(), "dimensionless")
 
     def get_solute_volume(self, solution: "Solution") -> ureg.Quantity:
         """Return the volume of the solutes."""
         # identify the predominant salt in the solution
-        salt = solution.get_salt()
-        solute_vol = ureg.Quantity(0, "L")
+        self._update_salts(solution)
+        salt = next(iter(self._salts.values()))[0]
+        # volume of the solutes, in L
+        solute_vol = 0.0
+        solvent_mass = solution.solvent_mass.to("kg").magnitude
+        # moles of the salt cation and anion
+        mol_cation = solution.components.get(salt.cation, 0)
+        mol_anion = solution.components.get(salt.anion, 0)
+        # solution temperature in Kelvin
+        temperature = solution.temperature.magnitude
+        ionic_strength = solution.ionic_strength
 
         # use the pitzer approach if parameters are available
         pitzer_calc = False
 
-        param = solution.get_property(salt.formula, "model_parameters.molar_volume_pitzer")
+        param = _get_pitzer_params(solution, salt.formula, "molar_volume_pitzer")
         if param is not None:
+            beta0, beta1, beta2, C_phi, V_o = param
+
             # determine the average molality of the salt
             # this is necessary for solutions inside e.g. an ion exchange
             # membrane, where the cation and anion concentrations may be
             # unequal
-            molality = (solution.get_amount(salt.cation, "mol/kg") + solution.get_amount(salt.anion, "mol/kg")) / 2
+            molality = ureg.Quantity((mol_cation + mol_anion) / solvent_mass / 2, "mol/kg")
 
             # determine alpha1 and alpha2 based on the type of salt
-            # see the May reference for the rules used to determine
-            # alpha1 and alpha2 based on charge
-            if salt.nu_cation >= 2 and salt.nu_anion >= 2:
-                if salt.nu_cation >= 3 or salt.nu_anion >= 3:
-                    alpha1 = 2.0
-                    alpha2 = 50.0
-                else:
-                    alpha1 = 1.4
-                    alpha2 = 12
-            else:
-                alpha1 = 2.0
-                alpha2 = 0.0
+            alpha1, alpha2 = _pitzer_alphas(salt.z_cation, salt.z_anion)
 
             apparent_vol = ac.get_apparent_volume_pitzer(
-                solution.ionic_strength,
+                ionic_strength,
                 molality,
                 alpha1,
                 alpha2,
-                ureg.Quantity(param["Beta0"]["value"]).magnitude,
-                ureg.Quantity(param["Beta1"]["value"]).magnitude,
-                ureg.Quantity(param["Beta2"]["value"]).magnitude,
-                ureg.Quantity(param["Cphi"]["value"]).magnitude,
-                ureg.Quantity(param["V_o"]["value"]).magnitude,
+                beta0,
+                beta1,
+                beta2,
+                C_phi,
+                V_o,
                 salt.z_cation,
                 salt.z_anion,
                 salt.nu_cation,
                 salt.nu_anion,
-                str(solution.temperature),
+                temperature,
             )
 
             solute_vol += (
-                apparent_vol
-                * (
-                    solution.get_amount(salt.cation, "mol") / salt.nu_cation
-                    + solution.get_amount(salt.anion, "mol") / salt.nu_anion
-                )
-                / 2
+                apparent_vol.to("L/mol").magnitude * (mol_cation / salt.nu_cation + mol_anion / salt.nu_anion) / 2
             )
 
             pitzer_calc = True
@@ -650,7 +742,7 @@ class NativeEOS(EOS):
 
             part_vol = solution.get_property(solute, "size.molar_volume")
             if part_vol is not None:
-                solute_vol += part_vol * ureg.Quantity(mol, "mol")
+                solute_vol += part_vol.to("L/mol").magnitude * mol
                 logger.debug(f"Updated solution volume using direct partial molar volume for solute {solute}")
 
             else:
@@ -658,10 +750,14 @@ class NativeEOS(EOS):
                     f"Volume of solute {solute} will be ignored because partial molar volume data are not available."
                 )
 
-        return solute_vol.to("L")
+        return ureg.Quantity(solute_vol, "L")
 
     def equilibrate(self, solution: "Solution") -> None:
         """Adjust the speciation of a Solution object to achieve chemical equilibrium."""
+        if self.pp is None:
+            warnings.warn("equilibrate() has no effect because PHREEQC could not be loaded on this system!")
+            return
+
         if self.ppsol is not None:
             self.ppsol.forget()
         self._setup_ppsol(solution)
@@ -706,7 +802,9 @@ class NativeEOS(EOS):
         memo[id(self)] = result
         for k, v in self.__dict__.items():
             if k == "pp":
-                result.pp = PhreeqPython(database=self.phreeqc_db, database_directory=self.db_path)
+                result.pp = (
+                    PhreeqPython(database=self.phreeqc_db, database_directory=self.db_path) if v is not None else None
+                )
                 continue
             setattr(result, k, copy.deepcopy(v, memo))
         return result
@@ -759,6 +857,17 @@ class PhreeqcEOS(NativeEOS):
 
         return ureg.Quantity(act, "dimensionless")
 
+    def get_activity_coefficients(
+        self, solution: "Solution", solutes: list[str] | None = None
+    ) -> dict[str, ureg.Quantity]:
+        """
+        Return the *molal scale* activity coefficients of several solutes, given a Solution
+        object.
+
+        PHREEQC is queried once for each solute, rather than using the NativeEOS models.
+        """
+        return EOS.get_activity_coefficients(self, solution, solutes)
+
     def get_osmotic_coefficient(self, solution: "Solution") -> ureg.Quantity:
         """
         Return the *molal scale* osmotic coefficient of solute, given a Solution
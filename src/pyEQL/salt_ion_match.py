@@ -12,6 +12,10 @@ species (e.g. Na+)
 
 """
 
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
 from monty.json import MSONable
 from pymatgen.core.ion import Ion
 
@@ -21,6 +25,10 @@ from pyEQL.utils import standardize_formula
 class Salt(MSONable):
     """Class to represent a salt."""
 
+    # Salt objects are created for every salt in a Solution and read in the activity and osmotic
+    # coefficient calculations, so their attributes are stored in slots rather than an instance dict
+    __slots__ = ("anion", "cation", "formula", "nu_anion", "nu_cation", "z_anion", "z_cation")
+
     def __init__(self, cation, anion) -> None:
         """
         Create a Salt object based on its component ions.
@@ -110,3 +118,46 @@ class Salt(MSONable):
         m_effective = 2 * ionic_strength / (self.nu_cation * self.z_cation**2 + self.nu_anion * self.z_anion**2)
 
         return m_effective.to("mol/kg")
+
+
+class SaltBatch(NamedTuple):
+    """
+    Charges, stoichiometric coefficients, and amounts of a group of salts, stored as parallel arrays
+    with one element per salt so that models can be evaluated for all the salts at once.
+    """
+
+    formulas: list[str]
+    z_cation: np.ndarray
+    z_anion: np.ndarray
+    nu_cation: np.ndarray
+    nu_anion: np.ndarray
+    mol: np.ndarray
+
+
+def generate_salt_arrays(salts: Iterable[Salt], mol: Iterable[float]) -> SaltBatch:
+    """
+    Collect the properties of several salts into a SaltBatch.
+
+    Args:
+        salts: The Salt objects to include.
+        mol: The amount of each salt, in the same order as ``salts``.
+
+    Returns:
+        SaltBatch: parallel arrays of the salt properties.
+
+    Examples:
+        >>> batch = generate_salt_arrays([Salt('Na+','Cl-'), Salt('Mg++','Cl-')], [0.5, 0.1])
+        >>> batch.formulas
+        ['NaCl', 'MgCl2']
+        >>> batch.nu_anion
+        array([1., 2.])
+    """
+    salts = list(salts)
+    return SaltBatch(
+        formulas=[s.formula for s in salts],
+        z_cation=np.array([s.z_cation for s in salts], dtype=float),
+        z_anion=np.array([s.z_anion for s in salts], dtype=float),
+        nu_cation=np.array([s.nu_cation for s in salts], dtype=float),
+        nu_anion=np.array([s.nu_anion for s in salts], dtype=float),
+        mol=np.array(list(mol), dtype=float),
+    )
@@ -2209,8 +2209,8 @@ class Solution(MSONable):
             D_final = D * np.exp(d / T_sol - d / T_ref) * mu_ref / mu
 
             if activity_correction:
-                A = _debye_parameter_activity(str(self.temperature)).to("kg**0.5/mol**0.5").magnitude / 2.303
-                B = _debye_parameter_B(str(self.temperature)).to("1/angstrom * kg**0.5/mol**0.5").magnitude
+                A = _debye_parameter_activity(self.temperature).to("kg**0.5/mol**0.5").magnitude / 2.303
+                B = _debye_parameter_B(self.temperature).to("1/angstrom * kg**0.5/mol**0.5").magnitude
                 z = self.get_property(solute, "charge")
                 IS = self.ionic_strength.magnitude
                 kappaa = B * IS**0.5 * a2 / (1 + IS**0.75)
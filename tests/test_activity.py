@@ -16,7 +16,16 @@ import platform
 import numpy as np
 import pytest
 
-from pyEQL.activity_correction import _debye_parameter_activity, _debye_parameter_B
+from pyEQL import ureg
+from pyEQL.activity_correction import (
+    _debye_parameter_activity,
+    _debye_parameter_B,
+    _debyehuckel_log_gamma,
+    get_activity_coefficient_davies,
+    get_activity_coefficient_debyehuckel,
+    get_activity_coefficient_guntelberg,
+    get_activity_coefficient_pitzer,
+)
 from pyEQL.solution import Solution
 
 ## Tests of the pitzer model
@@ -55,11 +64,59 @@ def test_units_and_equality():
     assert a1 == a2
 
 
+def test_activity_after_composition_change():
+    # the salts identified in a Solution are cached by the engine; make sure they
+    # are updated when the composition changes
+    s1 = Solution({"Na+": "0.5 mol/kg", "Cl-": "0.5 mol/kg"})
+    s2 = Solution({"Na+": "0.5 mol/kg", "Cl-": "0.5 mol/kg", "Mg+2": "1 mol/kg", "SO4-2": "1 mol/kg"})
+    assert s1.get_activity_coefficient("Mg+2") == 1
+    assert s1.get_activity_coefficient("Na+") != s2.get_activity_coefficient("Na+")
+
+    s1.add_solute("Mg+2", "1 mol/kg")
+    s1.add_solute("SO4-2", "1 mol/kg")
+    assert np.isclose(s1.get_activity_coefficient("Mg+2"), s2.get_activity_coefficient("Mg+2"))
+    assert np.isclose(s1.get_activity_coefficient("Na+"), s2.get_activity_coefficient("Na+"))
+    assert np.isclose(s1.get_osmotic_coefficient(), s2.get_osmotic_coefficient())
+
+
+def test_activity_predominant_salt():
+    # an ion that belongs to several salts takes its activity coefficient from the predominant one,
+    # i.e. Na+ should be treated as part of NaCl rather than Na2SO4
+    s1 = Solution({"Na+": "1 mol/kg", "Cl-": "0.7 mol/kg", "SO4-2": "0.15 mol/kg"})
+    assert list(s1.get_salt_dict().keys())[:2] == ["NaCl", "Na2SO4"]
+    assert s1.get_activity_coefficient("Na+") == s1.get_activity_coefficient("Cl-")
+    assert s1.get_activity_coefficient("Na+") != s1.get_activity_coefficient("SO4-2")
+    result = s1.engine.get_activity_coefficients(s1, ["SO4-2", "Na+", "Cl-"])
+    assert result["Na+"] == result["Cl-"]
+
+
+@pytest.mark.parametrize("engine", ["native", "ideal"])
+def test_activity_coefficients_batch(engine):
+    # evaluating all the solutes at once should give the same results as evaluating them one by one,
+    # for solutes with and without Pitzer parameters, and for solutes that are not part of any salt
+    s1 = Solution(
+        {"Na+": "0.5 mol/kg", "Cl-": "0.6 mol/kg", "Mg+2": "0.05 mol/kg", "SO4-2": "0.03 mol/kg", "Br-": "1 mmol/kg"},
+        engine=engine,
+    )
+    result = s1.engine.get_activity_coefficients(s1)
+    assert list(result.keys()) == list(s1.components.keys())
+    for solute, gamma in result.items():
+        assert np.isclose(gamma, s1.get_activity_coefficient(solute))
+
+    # solutes are returned in the order given, under the name given
+    result = s1.engine.get_activity_coefficients(s1, ["Cl-", "Na+"])
+    assert list(result.keys()) == ["Cl-", "Na+"]
+    assert result["Cl-"] == result["Na+"]
+
+
 def test_debye_params():
     # tests of the various Debye Huckel parameters
     # A should be equal to 0.509 at 25 C, for log base 10
     assert np.isclose(_debye_parameter_activity().magnitude / 2.303, 0.509, atol=1e-3)
     assert np.isclose(_debye_parameter_B().to("nm**-1 * kg**0.5/mol**0.5").magnitude, 3.29, atol=1e-2)
+    # temperatures can also be given as a number in Kelvin
+    assert np.isclose(_debye_parameter_activity(298.15), _debye_parameter_activity("25 degC"))
+    assert np.isclose(_debye_parameter_B(323.15), _debye_parameter_B("50 degC"))
 
 
 def test_activity_crc_HCl():
@@ -432,6 +489,36 @@ def test_activity_crc_k2so4():
         assert np.isclose(result, expected, rtol=0.05)
 
 
+def test_activity_crc_cuso4():
+    """
+    calculate the activity coefficient of CuSO4 at each concentration and compare
+    to experimental data
+
+    2:2 salts require different values of the Pitzer coefficients alpha1 and alpha2
+    than salts containing monovalent ions.
+
+    Experimental activity coefficient values at 25 degC are found in
+    *CRC Handbook of Chemistry and Physics*, Mean Activity Coefficients of Electrolytes as a Function of Concentration,
+    in: W.M. Haynes (Ed.), 92nd ed., 2011.
+
+    """
+    # list of concentrations to test, mol/kg
+    conc_list = [0.1, 0.2, 0.5, 1]
+
+    # list of published experimental activity coefficients
+    pub_activity_coeff = [0.150, 0.104, 0.0620, 0.0423]
+
+    for i, conc in enumerate(conc_list):
+        conc = str(conc) + "mol/kg"
+        sol = Solution()
+        sol.add_solute("Cu+2", conc)
+        sol.add_solute("SO4-2", conc)
+        result = sol.get_activity_coefficient("Cu+2")
+        expected = pub_activity_coeff[i]
+
+        assert np.isclose(result, expected, rtol=0.05)
+
+
 def test_activity_pitzer_nacl_1():
     """
     calculate the activity coefficient at each concentration and compare
@@ -469,6 +556,45 @@ def test_activity_pitzer_nacl_1():
         assert np.isclose(result, expected, rtol=0.05)
 
 
+def test_activity_pitzer_vectorized():
+    """
+    the Pitzer activity coefficient can be evaluated for several salts in one call,
+    with results identical to calculating each salt separately
+    """
+    ionic_strength = ureg.Quantity(1.5, "mol/kg")
+    molality = np.array([0.5, 0.25])
+    betas = np.array([[0.07831, 0.2677, 0, 0.000864], [0.2153, 3.29, -40.15, 0.02794]])
+    alphas = np.array([[2, 0], [1.4, 12]])
+    charges = np.array([[1, -1], [2, -2]])
+
+    result = get_activity_coefficient_pitzer(
+        ionic_strength, molality, *alphas.T, *betas.T, *charges.T, np.ones(2), np.ones(2), 298.15
+    )
+    for i in range(2):
+        expected = get_activity_coefficient_pitzer(
+            ionic_strength, ureg.Quantity(molality[i], "mol/kg"), *alphas[i], *betas[i], *charges[i], 1, 1
+        )
+        assert np.isclose(result[i], expected)
+
+
+def test_activity_debyehuckel_kernel():
+    """
+    the Debye-Huckel, Guntelberg and Davies models can be evaluated for several solutes in one call
+    """
+    ionic_strength = np.array([0.001, 0.05, 0.3])
+    z = np.array([1, -2, 3])
+    models = [
+        get_activity_coefficient_debyehuckel,
+        get_activity_coefficient_guntelberg,
+        get_activity_coefficient_davies,
+    ]
+
+    result = np.exp(_debyehuckel_log_gamma(ionic_strength, z, 298.15, np.arange(3)))
+    for i, model in enumerate(models):
+        expected = model(ureg.Quantity(ionic_strength[i], "mol/kg"), z[i], "25 degC")
+        assert np.isclose(result[i], expected)
+
+
 # The pitzer model diverges a bit from experimental data at high concentration
 @pytest.mark.xfail
 def test_water_activity_pitzer_nacl_1():
@@ -11,7 +11,8 @@ data rather than the theoretical result of the respective functions.
 
 import numpy as np
 
-from pyEQL import Solution
+from pyEQL import Solution, ureg
+from pyEQL.activity_correction import get_osmotic_coefficient_pitzer
 
 
 def test_osmotic_pressure():
@@ -39,6 +40,12 @@ class Test_osmotic_pitzer:
         assert s1.get_osmotic_coefficient().dimensionality == ""
         assert s1.get_osmotic_coefficient() >= 0
 
+    def test_empty_solution(self):
+        # pure water has no salts to average over
+        phi = Solution().get_osmotic_coefficient()
+        assert phi.dimensionality == ""
+        assert phi.magnitude == 1
+
     def test_osmotic_pitzer_ammoniumnitrate(self):
         """
         calculate the osmotic coefficient at each concentration and compare
@@ -94,3 +101,23 @@ class Test_osmotic_pitzer:
             expected = pub_osmotic_coeff[i]
 
             assert np.isclose(result, expected, rtol=0.05)
+
+    def test_osmotic_pitzer_vectorized(self):
+        """
+        the Pitzer osmotic coefficient can be evaluated for several salts in one call,
+        with results identical to calculating each salt separately
+        """
+        ionic_strength = ureg.Quantity(1.5, "mol/kg")
+        molality = np.array([0.5, 0.25])
+        betas = np.array([[0.07831, 0.2677, 0, 0.000864], [0.2153, 3.29, -40.15, 0.02794]])
+        alphas = np.array([[2, 0], [1.4, 12]])
+        charges = np.array([[1, -1], [2, -2]])
+
+        result = get_osmotic_coefficient_pitzer(
+            ionic_strength, molality, *alphas.T, *betas.T, *charges.T, np.ones(2), np.ones(2)
+        )
+        for i in range(2):
+            expected = get_osmotic_coefficient_pitzer(
+                ionic_strength, ureg.Quantity(molality[i], "mol/kg"), *alphas[i], *betas[i], *charges[i], 1, 1
+            )
+            assert np.isclose(result[i], expected)
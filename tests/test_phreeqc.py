@@ -6,12 +6,14 @@ This file contains tests for the volume and concentration-related methods
 used by pyEQL's Solution class
 """
 
+import copy
 import logging
 import platform
 
 import numpy as np
 import pytest
 
+import pyEQL.engines
 from pyEQL import Solution
 from pyEQL.engines import PhreeqcEOS
 
@@ -127,6 +129,26 @@ def test_init_engines():
     assert s.engine.ppsol is None
 
 
+def test_native_without_phreeqc(monkeypatch):
+    """
+    NativeEOS still works when PHREEQC cannot be loaded, e.g. on an unsupported architecture
+    """
+
+    def _raise_oserror(*args, **kwargs):
+        raise OSError
+
+    monkeypatch.setattr(pyEQL.engines, "PhreeqPython", _raise_oserror)
+    s = Solution([["Na+", "0.5 mol/kg"], ["Cl-", "0.5 mol/kg"]], engine="native")
+    assert s.engine.pp is None
+    comp = s.components.copy()
+    with pytest.warns(UserWarning, match="no effect"):
+        s.equilibrate()
+    assert s.components == comp
+    assert s.get_activity_coefficient("Na+").magnitude < 1
+    s2 = copy.deepcopy(s)
+    assert s2.engine.pp is None
+
+
 def test_conductivity(s1):
     # even an empty solution should have some conductivity
     assert s1.conductivity > 0
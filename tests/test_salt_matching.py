@@ -12,7 +12,7 @@ import numpy as np
 import pytest
 
 import pyEQL
-from pyEQL.salt_ion_match import Salt
+from pyEQL.salt_ion_match import Salt, generate_salt_arrays
 
 
 def test_salt_init():
@@ -35,6 +35,29 @@ def test_salt_init():
     assert s.z_anion == -1
 
 
+def test_salt_serialization():
+    s = Salt("Fe+3", "OH-1")
+    s2 = Salt.from_dict(s.as_dict())
+    for attr in Salt.__slots__:
+        assert getattr(s2, attr) == getattr(s, attr)
+    assert s.__dict__ == {}
+
+
+def test_generate_salt_arrays():
+    salts = [Salt("Na[+1]", "Cl[-1]"), Salt("Mg[+2]", "SO4[-2]"), Salt("Fe+3", "OH-1")]
+    batch = generate_salt_arrays(salts, [0.5, 0.2, 0.1])
+    assert batch.formulas == ["NaCl", "MgSO4", "Fe(OH)3"]
+    assert np.all(batch.z_cation == [1, 2, 3])
+    assert np.all(batch.z_anion == [-1, -2, -1])
+    assert np.all(batch.nu_cation == [1, 1, 1])
+    assert np.all(batch.nu_anion == [1, 1, 3])
+    assert np.all(batch.mol == [0.5, 0.2, 0.1])
+
+    batch = generate_salt_arrays([], [])
+    assert batch.formulas == []
+    assert len(batch.mol) == 0
+
+
 def test_empty_solution():
     """
     test matching a solution that contains no solutes other than water